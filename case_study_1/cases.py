@@ -1,14 +1,26 @@
-import os
 import time
 
-from psutil import Process
-
 from lib import GraphStructure
-
-def case_1_memory_analysis(graph: GraphStructure) -> float:
-    process = Process(os.getpid())
-    mem_usage = process.memory_info().rss / (1024 * 1024)
-    return mem_usage
+from lib.classes.memory.memory_tracker import MemoryTracker
+
+def case_1_memory_analysis(graph: GraphStructure, load_phase: dict[str, int]) -> tuple[float, float, float, float]:
+    '''
+    Returns the structure's own size in mega bytes, its bytes per edge, and the peak mega bytes
+    allocated while loading it and while running a BFS and a DFS on it.
+    '''
+    tracker = MemoryTracker()
+    with tracker.phase('search'):
+        graph.search_breadth_first(1)
+        graph.search_depth_first(1)
+
+    memory_usage = graph.get_memory_usage()
+    mega_byte = 1024 * 1024
+    return (
+        memory_usage['total_bytes'] / mega_byte,
+        memory_usage['bytes_per_edge'],
+        load_phase['peak_bytes'] / mega_byte,
+        tracker.phases['search']['peak_bytes'] / mega_byte,
+    )
 
 def cases_2_3_bfs_dfs_performance(graph: GraphStructure, start_nodes: list[int]) -> tuple[float,float]:
     def measure_search_time(search_function):
@@ -2,6 +2,7 @@ import random
 import os
 
 from lib import AdjacencyMatrix, AdjacencyVector
+from lib.classes.memory.memory_tracker import MemoryTracker
 
 from case_study_1.cases import (
     case_1_memory_analysis,
@@ -15,12 +16,17 @@ from case_study_1.cases import (
 def show_results(case_1, case_2, case_3, case_4, case_5, case_6, case_7) -> None:
     print("\n--- Case Study Results ---\n")
     
-    print("Case 1: Memory Usage (in bytes)")
-    if case_1[0] is None:
-        print("  Adjacency Matrix: Analysis skipped due to memory error")
-    else:
-        print(f"  Adjacency Matrix: {case_1[0]:,} mega bytes")
-    print(f"  Adjacency Vector: {case_1[1]:,} mega bytes\n")
+    print("Case 1: Memory Usage (in mega bytes)")
+    for name, memory in (("Adjacency Matrix", case_1[0]), ("Adjacency Vector", case_1[1])):
+        if memory is None:
+            print(f"  {name}: Analysis skipped due to memory error")
+            continue
+        structure_size, bytes_per_edge, load_peak, search_peak = memory
+        print(
+            f"  {name}: {structure_size:,.2f} MB ({bytes_per_edge:,.1f} bytes per edge), "
+            f"peak while loading: {load_peak:,.2f} MB, peak during BFS + DFS: {search_peak:,.2f} MB"
+        )
+    print()
 
     print("Case 2 & 3: Average Search Times (in seconds)")
     if case_2[0] is None:
@@ -64,12 +70,14 @@ def run_case_study(graph_file_path: str) -> list[tuple[float, float, float]] | N
 
     # --- Part 1: Data Analysis (case 1, 2, 3) ---
     case_1 = []
+    tracker = MemoryTracker()
 
     # Adjacency Matrix
     print("\nBuilding Adjacency Matrix Representation...")
     try:
-        graph = AdjacencyMatrix(graph_file_path)
-        case_1.append(case_1_memory_analysis(graph))
+        with tracker.phase('matrix_load'):
+            graph = AdjacencyMatrix(graph_file_path)
+        case_1.append(case_1_memory_analysis(graph, tracker.phases['matrix_load']))
         node_count = graph.get_node_count()
         num_runs = min(100, node_count)
         start_nodes = random.sample(range(1, node_count + 1), num_runs)
@@ -83,8 +91,10 @@ def run_case_study(graph_file_path: str) -> list[tuple[float, float, float]] | N
 
     # Adjacency Vector
     print("\nBuilding Adjacency Vector Representation...")
-    graph = AdjacencyVector(graph_file_path)
-    case_1.append(case_1_memory_analysis(graph))
+    graph = None
+    with tracker.phase('vector_load'):
+        graph = AdjacencyVector(graph_file_path)
+    case_1.append(case_1_memory_analysis(graph, tracker.phases['vector_load']))
     node_count = graph.get_node_count()
     num_runs = min(100, node_count)
     start_nodes = random.sample(range(1, node_count + 1), num_runs)
@@ -23,32 +23,11 @@ def case_2_dijkstra_performance_comparison(graph: GraphStructure) -> tuple[float
     avg_time_heap = measure_dijkstra_time(DijkstraHeap)
     return avg_time_vector, avg_time_heap
 
-def case_3_distance_between_researchers(graph: GraphStructure, researchers_names_file_path: str, start_researcher: str, end_researchers: list[str]) -> list[dict[str, tuple[float, str]]]:
-    end_researchers_indexes = []
-    researchers_names = ['']
-    
-    with open(researchers_names_file_path, 'r') as f:
-        for line in f.readlines():
-            line = line.strip().split(',')
-            i = line[0]
-            name = line[1]
-            researchers_names.append(name.strip())
-            if start_researcher == name:
-                start_researcher_index = int(i)
-            if name in end_researchers:
-                end_researchers_indexes.append(int(i))
+def case_3_distance_between_researchers(graph: GraphStructure, start_researcher: str, end_researchers: list[str]) -> list[dict[str, tuple[float, str]]]:
+    distances_and_fathers = graph.get_all_distances_and_fathers_from_start_node(start_researcher)
 
-    if not start_researcher_index:
-        raise ValueError(f'Start researcher "{start_researcher}" not found in researchers names file.')
-    distances_and_fathers = graph.get_all_distances_and_fathers_from_start_node(start_researcher_index)
-
-    print(end_researchers_indexes)
-    return [
-        {
-            researchers_names[end]: (
-                distances_and_fathers[end][0],
-                researchers_names[distances_and_fathers[end][1]] if distances_and_fathers[end][1] is not None else None
-            )
-        }
-        for end in end_researchers_indexes
-    ]
\ No newline at end of file
+    result = []
+    for end_researcher in end_researchers:
+        distance, father = distances_and_fathers[graph.resolve_node(end_researcher)]
+        result.append({end_researcher: (distance, graph.get_node_label(father) if father is not None else None)})
+    return result
\ No newline at end of file
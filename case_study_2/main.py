@@ -45,12 +45,11 @@ def run_case_study_2_part_1(graph_file_path: str):
 
 def run_case_study_2_part_2():
     # Case 3: Distance Between Dijkstra and other researchers
-    graph = AdjacencyVector('case_study_2/graphs/rede_colaboracao.txt')
-    researchers_names_file_path = 'case_study_2/graphs/rede_colaboracao_vertices.txt'
+    graph = AdjacencyVector('case_study_2/graphs/rede_colaboracao.txt', labels_file_path='case_study_2/graphs/rede_colaboracao_vertices.txt')
     start_researcher = 'Edsger W. Dijkstra'
     end_researchers = ['Alan M. Turing', 'J. B. Kruskal', 'Jon M. Kleinberg', 'Éva Tardos', 'Daniel R. Figueiredo']
     print("Calculating distances between Dijkstra and other researchers...")
-    result = case_3_distance_between_researchers(graph, researchers_names_file_path, start_researcher, end_researchers)
+    result = case_3_distance_between_researchers(graph, start_researcher, end_researchers)
     for item in result:
         for name, (distance, father) in item.items():
             print(f"Distance from {start_researcher} to {name}: {distance} (via {father})")
@@ -0,0 +1,22 @@
+import time
+
+from lib import GraphStructure
+
+def case_1_traversal_times(graph: GraphStructure, start_nodes: list[int]) -> tuple[float, float]:
+    def measure_time(search_function) -> float:
+        total_time = 0
+        for start_node in start_nodes:
+            start_time = time.perf_counter()
+            search_function(start_node)
+            end_time = time.perf_counter()
+            total_time += (end_time - start_time)
+        return total_time / len(start_nodes)
+
+    bfs_avg_time = measure_time(graph.search_breadth_first)
+    dijkstra_avg_time = measure_time(graph.get_all_distances_and_fathers_from_start_node)
+    return bfs_avg_time, dijkstra_avg_time
+
+def case_2_reordering_time(graph: GraphStructure, ordering: str) -> float:
+    start_time = time.perf_counter()
+    graph.reorder(ordering)
+    return time.perf_counter() - start_time
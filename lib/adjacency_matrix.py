@@ -1,8 +1,10 @@
 from .generic_structure import GraphStructure
+from lib.classes.memory.deep_size_counter import DeepSizeCounter
 
 class AdjacencyMatrix(GraphStructure):
-    def __init__(self, file_path: str, is_directed: bool = False, reverse: bool = False) -> None:
+    def __init__(self, file_path: str, is_directed: bool = False, reverse: bool = False, labeled: bool = False, labels_file_path: str = '', weight_scale: int | None = None) -> None:
         self._is_directed = is_directed
+        self.weight_scale = weight_scale
         try:
             self._has_negative_weight = False
             with open(file_path, 'r') as f:
@@ -12,20 +14,15 @@ class AdjacencyMatrix(GraphStructure):
                     for _ in range(node_count + 1)
                 ]
 
-                for line in f.readlines():
-                    nodes = line.strip().split()
-                    if len(nodes) == 2:
-                        nodes.append('1.0')
-                    if reverse:
-                        nodes[0], nodes[1] = nodes[1], nodes[0]
-                    self.add_edge(int(nodes[0]), int(nodes[1]), float(nodes[2]))
+                for node_1, node_2, weight in self._read_edges(f, node_count, reverse, labeled, labels_file_path):
+                    self._add_edge(node_1, node_2, weight)
                     if not is_directed:
-                        self.add_edge(int(nodes[1]), int(nodes[0]), float(nodes[2]))
+                        self._add_edge(node_2, node_1, weight)
         except MemoryError as e:
             print(f"Não foi possível criar a matriz de adjacência devido à memória insuficiente: {e}")
             raise e
 
-    def add_edge(self, node_1: int, node_2: int, weight: float) -> None:
+    def _add_edge(self, node_1: int, node_2: int, weight: float) -> None:
         self.validate_node_index(node_1, node_2)
         if weight < 0:
             self._has_negative_weight = True
@@ -42,6 +39,28 @@ class AdjacencyMatrix(GraphStructure):
     def get_node_count(self) -> int:
         return len(self.adjacency_matrix) - 1
 
-    def get_neighbors(self, node: int) -> list[tuple[int, float]]:
+    def _get_out_neighbors(self, node: int) -> list[tuple[int, float]]:
         self.validate_node_index(node)
-        return [(i, weight) for i, weight in enumerate(self.adjacency_matrix[node]) if weight != '']
\ No newline at end of file
+        return [(i, weight) for i, weight in enumerate(self.adjacency_matrix[node]) if weight != '']
+
+    def _relabel_nodes(self, new_ids: list[int]) -> None:
+        # Rows are rebuilt one at a time and each old row is freed right away, so the peak is one matrix plus one row.
+        size = len(self.adjacency_matrix)
+        adjacency_matrix = [None] * size
+        adjacency_matrix[0] = self.adjacency_matrix[0]
+        for node in range(1, size):
+            new_row = [''] * size
+            for neighbor, weight in enumerate(self.adjacency_matrix[node]):
+                if weight != '':
+                    new_row[new_ids[neighbor]] = weight
+            adjacency_matrix[new_ids[node]] = new_row
+            self.adjacency_matrix[node] = None
+        self.adjacency_matrix = adjacency_matrix
+
+    def _get_adjacency_memory_breakdown(self, counter: DeepSizeCounter) -> dict[str, int]:
+        rows = self.adjacency_matrix
+        return {
+            'row_list': counter.shallow(rows),
+            'rows': sum(counter.shallow(row) for row in rows),
+            'weights': counter.shallow('') + sum(counter.shallow(weight) for row in rows for weight in row if weight != ''),
+        }
\ No newline at end of file
@@ -1,24 +1,21 @@
 from .generic_structure import GraphStructure
+from lib.classes.memory.deep_size_counter import DeepSizeCounter
 
 class AdjacencyVector(GraphStructure):
-    def __init__(self, file_path: str, is_directed: bool = False, reverse: bool = False) -> None:
+    def __init__(self, file_path: str, is_directed: bool = False, reverse: bool = False, labeled: bool = False, labels_file_path: str = '', weight_scale: int | None = None) -> None:
         self._is_directed = is_directed
+        self.weight_scale = weight_scale
         with open(file_path, 'r') as f:
             self._has_negative_weight = False
             node_count = int(f.readline().strip())
             self.adjacency_vector = [[] for _ in range(node_count + 1)]
 
-            for line in f.readlines():
-                nodes = line.strip().split()
-                if len(nodes) == 2:
-                    nodes.append('1.0')
-                if reverse:
-                        nodes[0], nodes[1] = nodes[1], nodes[0]
-                self.add_edge(int(nodes[0]), int(nodes[1]), float(nodes[2]))
+            for node_1, node_2, weight in self._read_edges(f, node_count, reverse, labeled, labels_file_path):
+                self._add_edge(node_1, node_2, weight)
                 if not is_directed:
-                    self.add_edge(int(nodes[1]), int(nodes[0]), float(nodes[2]))
+                    self._add_edge(node_2, node_1, weight)
 
-    def add_edge(self, node_1: int, node_2: int, weight: float) -> None:
+    def _add_edge(self, node_1: int, node_2: int, weight: float) -> None:
         self.validate_node_index(node_1, node_2)
         if weight < 0:
             self._has_negative_weight = True
@@ -36,6 +33,21 @@ class AdjacencyVector(GraphStructure):
     def get_node_count(self) -> int:
         return len(self.adjacency_vector) - 1
 
-    def get_out_neighbors(self, node: int) -> list[tuple[int, float]]:
+    def _get_out_neighbors(self, node: int) -> list[tuple[int, float]]:
         self.validate_node_index(node)
-        return self.adjacency_vector[node]
\ No newline at end of file
+        return self.adjacency_vector[node]
+
+    def _relabel_nodes(self, new_ids: list[int]) -> None:
+        adjacency_vector = [[] for _ in range(len(self.adjacency_vector))]
+        for node in range(1, len(self.adjacency_vector)):
+            adjacency_vector[new_ids[node]] = sorted((new_ids[neighbor], weight) for neighbor, weight in self.adjacency_vector[node])
+        self.adjacency_vector = adjacency_vector
+
+    def _get_adjacency_memory_breakdown(self, counter: DeepSizeCounter) -> dict[str, int]:
+        neighbor_lists = self.adjacency_vector
+        return {
+            'node_list': counter.shallow(neighbor_lists),
+            'neighbor_lists': sum(counter.shallow(neighbors) for neighbors in neighbor_lists),
+            'edge_tuples': sum(counter.shallow(edge) for neighbors in neighbor_lists for edge in neighbors),
+            'node_ids_and_weights': sum(counter.shallow(value) for neighbors in neighbor_lists for edge in neighbors for value in edge),
+        }
\ No newline at end of file
@@ -0,0 +1,35 @@
+from lib.classes.dijkstra.generic_dijkstra_structures_manager import GenericDijkstraStructuresManager
+
+class DijkstraBuckets(GenericDijkstraStructuresManager):
+    '''Dial's bucket queue; requires integer weights, i.e. a graph loaded with weight_scale.'''
+    def __init__(self, start_node: int, n: int, exact: bool = False) -> None:
+        if not exact:
+            raise ValueError('Bucket queue requires integer weights; load the graph with a weight_scale.')
+        self.distances_and_fathers = [(float('inf'), None)] * (n + 1)
+        self.buckets: dict[int, list[tuple[int, int | None]]] = {0: [(start_node, None)]}
+        self.current_distance = 0
+
+    def get_next_min(self) -> tuple[int, int] | None:
+        while self.buckets:
+            bucket = self.buckets.get(self.current_distance)
+            if not bucket:
+                self.buckets.pop(self.current_distance, None)
+                self.current_distance += 1
+                continue
+            node, father = bucket.pop()
+            if self.distances_and_fathers[node][0] == float('inf'):
+                self.distances_and_fathers[node] = (self.current_distance, father)
+                return node, self.current_distance
+        return None
+
+    def update_distance(self, current_node: int, current_distance: int, node: int, weight: int) -> None:
+        if self.distances_and_fathers[node][0] != float('inf'):
+            return
+        new_distance = current_distance + weight
+        if new_distance in self.buckets:
+            self.buckets[new_distance].append((node, current_node))
+        else:
+            self.buckets[new_distance] = [(node, current_node)]
+
+    def result(self) -> list[tuple[int, int | None]]:
+        return self.distances_and_fathers
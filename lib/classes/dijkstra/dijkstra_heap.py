@@ -2,7 +2,9 @@ import heapq
 from lib.classes.dijkstra.generic_dijkstra_structures_manager import GenericDijkstraStructuresManager
 
 class DijkstraHeap(GenericDijkstraStructuresManager):
-    def __init__(self, start_node: int, n: int) -> None:
+    def __init__(self, start_node: int, n: int, exact: bool = False) -> None:
+        if exact:
+            self.update_distance = self._update_distance_exact
         self.distances_and_fathers = [(float('inf'), None)] * (n + 1)
         self.min_heap = [(0, None, start_node)]
 
@@ -20,5 +22,10 @@ class DijkstraHeap(GenericDijkstraStructuresManager):
             return
         heapq.heappush(self.min_heap, (round(current_distance + weight, 2), current_node, node))
 
+    def _update_distance_exact(self, current_node: int, current_distance: int, node: int, weight: int) -> None:
+        if self.distances_and_fathers[node][0] != float('inf'):
+            return
+        heapq.heappush(self.min_heap, (current_distance + weight, current_node, node))
+
     def result(self) -> list[float]:
         return self.distances_and_fathers
@@ -1,7 +1,9 @@
 from lib.classes.dijkstra.generic_dijkstra_structures_manager import GenericDijkstraStructuresManager
 
 class DijkstraVector(GenericDijkstraStructuresManager):
-    def __init__(self, start_node: int, n: int) -> None:
+    def __init__(self, start_node: int, n: int, exact: bool = False) -> None:
+        if exact:
+            self.update_distance = self._update_distance_exact
         self.boundary_set_size = 1
         self.distances_and_fathers = [(float('inf'), None)] * (n + 1)
         self.distances_and_fathers[start_node] = (0, None)
@@ -31,5 +33,15 @@ class DijkstraVector(GenericDijkstraStructuresManager):
         if old_distance == float('inf'):
             self.boundary_set_size += 1
 
+    def _update_distance_exact(self, current_node: int, current_distance: int, node: int, weight: int) -> None:
+        if self.visited[node]:
+            return
+        new_distance = current_distance + weight
+        old_distance, _ = self.distances_and_fathers[node]
+        if new_distance < old_distance:
+            self.distances_and_fathers[node] = (new_distance, current_node)
+        if old_distance == float('inf'):
+            self.boundary_set_size += 1
+
     def result(self) -> list[tuple[float, int | None]]:
         return self.distances_and_fathers
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 
 class GenericDijkstraStructuresManager(ABC):
     @abstractmethod
-    def __init__(self, start_node:int, n: int) -> None: ...
+    def __init__(self, start_node:int, n: int, exact: bool = False) -> None: ...
 
     @abstractmethod
     def get_next_min(self) -> tuple[int, float] | None: ...
@@ -0,0 +1,65 @@
+class VertexLabels:
+    '''Bidirectional mapping between dense 1-based node ids and string labels.'''
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._labels: list[str | None] = [None]
+
+    @classmethod
+    def load(cls, file_path: str) -> 'VertexLabels':
+        '''Reads an "id,label" per line file, such as rede_colaboracao_vertices.txt.'''
+        labels = cls()
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                node, label = line.rstrip('\n').split(',', 1)
+                labels.assign(int(node), label.strip())
+        return labels
+
+    def save(self, file_path: str) -> None:
+        '''Writes the mapping in the same "id,label" format read by load.'''
+        with open(file_path, 'w', encoding='utf-8') as f:
+            for node, label in enumerate(self._labels):
+                if label is not None:
+                    f.write(f'{node},{label}\n')
+
+    def assign(self, node: int, label: str) -> None:
+        '''Binds a label to an explicit node id.'''
+        if node < 1:
+            raise ValueError(f'Node id {node} is not valid; ids start at 1.')
+        if label in self._ids and self._ids[label] != node:
+            raise ValueError(f'Label "{label}" is already bound to node {self._ids[label]}.')
+        if node >= len(self._labels):
+            self._labels.extend([None] * (node + 1 - len(self._labels)))
+        elif self._labels[node] is not None:
+            del self._ids[self._labels[node]]
+        self._labels[node] = label
+        self._ids[label] = node
+
+    def intern(self, label: str) -> int:
+        '''Returns the id of a label, binding it to the next free id if it is new.'''
+        node = self._ids.get(label)
+        if node is None:
+            node = len(self._labels)
+            self._labels.append(label)
+            self._ids[label] = node
+        return node
+
+    def get_id(self, label: str) -> int:
+        node = self._ids.get(label)
+        if node is None:
+            raise ValueError(f'Label "{label}" not found.')
+        return node
+
+    def get_label(self, node: int) -> str | None:
+        return self._labels[node] if 0 <= node < len(self._labels) else None
+
+    def get_max_id(self) -> int:
+        return len(self._labels) - 1
+
+    def __contains__(self, label: str) -> bool:
+        return label in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
@@ -0,0 +1,38 @@
+import sys
+
+
+class DeepSizeCounter:
+    '''
+    Sums sys.getsizeof over objects, counting each object once across every call,
+    so objects shared between structures (small ints, interned strings, weights
+    stored in both directions of an undirected edge) are not counted twice.
+    '''
+
+    def __init__(self) -> None:
+        self._seen: set[int] = set()
+
+    def shallow(self, obj: object) -> int:
+        '''Returns the size of obj itself, not of the objects it references.'''
+        if id(obj) in self._seen:
+            return 0
+        self._seen.add(id(obj))
+        return sys.getsizeof(obj)
+
+    def deep(self, obj: object) -> int:
+        '''Returns the size of obj and of every object reachable from it not counted before.'''
+        total = 0
+        stack = [obj]
+        while stack:
+            current = stack.pop()
+            if id(current) in self._seen:
+                continue
+            self._seen.add(id(current))
+            total += sys.getsizeof(current)
+            if isinstance(current, dict):
+                stack.extend(current.keys())
+                stack.extend(current.values())
+            elif isinstance(current, (list, tuple, set, frozenset)):
+                stack.extend(current)
+            elif hasattr(current, '__dict__'):
+                stack.append(current.__dict__)
+        return total
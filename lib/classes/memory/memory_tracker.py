@@ -0,0 +1,36 @@
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class MemoryTracker:
+    '''
+    Records Python heap usage of named phases, such as loading a graph or running a search, with tracemalloc.
+    For each phase it keeps the bytes still allocated when the phase ends and the peak reached above the
+    memory in use when it started. Phases are meant to run one after another, not nested.
+    '''
+
+    def __init__(self) -> None:
+        self.phases: dict[str, dict[str, int]] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started_here = not tracemalloc.is_tracing()
+        if started_here:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        start_memory, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            current_memory, peak_memory = tracemalloc.get_traced_memory()
+            self.phases[name] = {
+                'retained_bytes': current_memory - start_memory,
+                'peak_bytes': peak_memory - start_memory,
+            }
+            if started_here:
+                tracemalloc.stop()
+
+    def get_peak_bytes(self) -> int:
+        '''Returns the highest peak among the recorded phases.'''
+        return max((phase['peak_bytes'] for phase in self.phases.values()), default=0)
@@ -1,14 +1,30 @@
 from abc import ABC, abstractmethod
 from collections import deque
-from typing import Type
+from typing import Iterator, TextIO, Type
 from lib.classes.dijkstra.dijkstra_heap import DijkstraHeap
 from lib.classes.dijkstra.generic_dijkstra_structures_manager import GenericDijkstraStructuresManager
+from lib.classes.labels.vertex_labels import VertexLabels
+from lib.classes.memory.deep_size_counter import DeepSizeCounter
+
+
+ORDERINGS = ('rcm', 'bfs', 'degree')
 
 
 class GraphStructure(ABC):
+    labels: VertexLabels | None = None
+    weight_scale: int | None = None
+    _original_ids: list[int] | None = None
+    _internal_ids: list[int] | None = None
+
     @abstractmethod
-    def __init__(self, file_path: str, is_directed: bool) -> None:
-        '''Initializes the graph structure from a text file.'''
+    def __init__(self, file_path: str, is_directed: bool, reverse: bool = False, labeled: bool = False, labels_file_path: str = '', weight_scale: int | None = None) -> None:
+        '''
+        Initializes the graph structure from a text file.
+        With labeled set, node ids in the edge file are arbitrary strings interned into ids 1 to n;
+        labels_file_path names an "id,label" file loaded before the edges.
+        With weight_scale set, weights are stored as integers in units of 1 / weight_scale (100 keeps two decimals)
+        and shortest paths use exact integer arithmetic; distances are scaled back when returned.
+        '''
         pass
 
     @property
@@ -24,15 +40,206 @@ class GraphStructure(ABC):
         pass
 
     @abstractmethod
-    def get_out_neighbors(self, node: int) -> list[int]:
-        '''Returns the list of out-neighboring nodes for the given node.'''
+    def _get_out_neighbors(self, node: int) -> list[tuple[int, float]]:
+        '''
+        Returns the stored (neighbor, weight) pairs for the given node.
+        Nodes are internal ids, which differ from the file's ids after reorder.
+        '''
+        pass
+
+    @abstractmethod
+    def _add_edge(self, node_1: int, node_2: int, weight: float) -> None:
+        '''Stores an edge between internal ids, with the weight already in storage units.'''
         pass
 
+    def get_out_neighbors(self, node: int | str) -> list[tuple[int, float]]:
+        '''Returns the list of (neighbor, weight) pairs for the given node, with weights in the file's units.'''
+        neighbors = self._get_out_neighbors(self._resolve_internal(node))
+        if self.weight_scale is not None:
+            scale = self.weight_scale
+            neighbors = [(neighbor, weight / scale) for neighbor, weight in neighbors]
+        if self._original_ids is None:
+            return neighbors
+        original_ids = self._original_ids
+        return [(original_ids[neighbor], weight) for neighbor, weight in neighbors]
+
+    def add_edge(self, node_1: int | str, node_2: int | str, weight: float) -> None:
+        '''Adds a directed edge from node_1 to node_2; weight is in the file's units.'''
+        if self.weight_scale is not None:
+            weight = round(weight * self.weight_scale)
+        self._add_edge(self._resolve_internal(node_1), self._resolve_internal(node_2), weight)
+
+    @abstractmethod
+    def _relabel_nodes(self, new_ids: list[int]) -> None:
+        '''Rebuilds the adjacency so that node i is stored as node new_ids[i].'''
+        pass
+
+    @abstractmethod
+    def _get_adjacency_memory_breakdown(self, counter: DeepSizeCounter) -> dict[str, int]:
+        '''Returns the bytes used by each part of the adjacency storage.'''
+        pass
+
+    def get_memory_usage(self) -> dict[str, int | float | dict[str, int]]:
+        '''
+        Returns the deep size in bytes of the graph's own data: the adjacency storage, the bytes per edge
+        it costs and a breakdown that also covers labels and the reordering permutation.
+        Objects shared between parts are counted once, in the first part listed.
+        '''
+        counter = DeepSizeCounter()
+        breakdown = self._get_adjacency_memory_breakdown(counter)
+        adjacency_bytes = sum(breakdown.values())
+        breakdown['labels'] = counter.deep(self.labels) if self.labels is not None else 0
+        breakdown['node_permutation'] = counter.deep([self._original_ids, self._internal_ids]) if self._original_ids is not None else 0
+        edge_count = self.get_edge_count()
+        return {
+            'total_bytes': sum(breakdown.values()),
+            'adjacency_bytes': adjacency_bytes,
+            'bytes_per_edge': adjacency_bytes / edge_count if edge_count else 0.0,
+            'breakdown': breakdown,
+        }
+
     @abstractmethod
     def get_node_count(self) -> int:
         '''Returns the total number of nodes in the graph.'''
         pass
 
+    def _read_edges(self, f: TextIO, node_count: int, reverse: bool, labeled: bool, labels_file_path: str) -> Iterator[tuple[int, int, float]]:
+        '''Yields the (node_1, node_2, weight) edges of an open graph file, interning labels when requested.'''
+        if self.weight_scale is not None and (not isinstance(self.weight_scale, int) or isinstance(self.weight_scale, bool) or self.weight_scale <= 0):
+            raise ValueError(f'weight_scale must be a positive integer, got {self.weight_scale!r}.')
+        if labels_file_path:
+            self.labels = VertexLabels.load(labels_file_path)
+        elif labeled:
+            self.labels = VertexLabels()
+
+        for line in f:
+            nodes = line.strip().split()
+            if not nodes:
+                continue
+            weight = float(nodes[2]) if len(nodes) > 2 else 1.0
+            if self.weight_scale is not None:
+                weight = round(weight * self.weight_scale)
+            if labeled:
+                node_1, node_2 = self.labels.intern(nodes[0]), self.labels.intern(nodes[1])
+                if self.labels.get_max_id() > node_count:
+                    raise ValueError(f'Graph file declares {node_count} nodes but has more distinct labels.')
+            else:
+                node_1, node_2 = int(nodes[0]), int(nodes[1])
+            if reverse:
+                node_1, node_2 = node_2, node_1
+            yield node_1, node_2, weight
+
+    def _unscale_distances(self, distances: list[tuple[float, int | None]]) -> list[tuple[float, int | None]]:
+        '''Converts distances computed over integer weights back to the file's units.'''
+        if self.weight_scale is None:
+            return distances
+        scale = self.weight_scale
+        return [(distance / scale, node) for distance, node in distances]
+
+    def resolve_node(self, node: int | str) -> int:
+        '''Returns the node id for a node given either by id or by label.'''
+        if isinstance(node, str):
+            if self.labels is None:
+                raise ValueError(f'Graph has no labels; cannot resolve node "{node}".')
+            return self.labels.get_id(node)
+        return node
+
+    def _resolve_internal(self, node: int | str) -> int:
+        '''Validates a node given by id or label and returns its internal id.'''
+        node = self.resolve_node(node)
+        self.validate_node_index(node)
+        return self._internal_ids[node] if self._internal_ids is not None else node
+
+    def _to_original_ids(self, values: list[tuple], node_position: int) -> list[tuple]:
+        '''Reindexes a per-node result by original id, translating the node stored at node_position of each entry.'''
+        if self._original_ids is None:
+            return values
+        original_ids = self._original_ids
+        exported = [values[0]] * len(values)
+        for node in range(1, len(values)):
+            value = values[node]
+            if value[node_position] is not None:
+                value = value[:node_position] + (original_ids[value[node_position]],) + value[node_position + 1:]
+            exported[original_ids[node]] = value
+        return exported
+
+    def _components_to_original_ids(self, components: list[list[int]]) -> list[list[int]]:
+        if self._original_ids is None:
+            return components
+        return [sorted(self._original_ids[node] for node in component) for component in components]
+
+    def reorder(self, ordering: str = 'rcm') -> None:
+        '''
+        Relabels the nodes internally so that nodes visited together are stored close to each other, using
+        reverse Cuthill-McKee ("rcm"), breadth-first ("bfs") or decreasing out degree ("degree") order.
+        "identity" keeps the current order and only rebuilds the storage, as a baseline for the others.
+        Public methods keep taking and returning the original node ids.
+        '''
+        node_count = self.get_node_count()
+        if ordering == 'identity':
+            order = list(range(1, node_count + 1))
+        elif ordering == 'rcm':
+            order = self._get_breadth_first_order(by_degree=True)[::-1]
+        elif ordering == 'bfs':
+            order = self._get_breadth_first_order()
+        elif ordering == 'degree':
+            order = sorted(range(1, node_count + 1), key=lambda node: len(self._get_out_neighbors(node)), reverse=True)
+        else:
+            raise ValueError(f'Unknown ordering "{ordering}"; expected "identity" or one of {ORDERINGS}.')
+
+        new_ids = [0] * (node_count + 1)
+        for new_id, node in enumerate(order, start=1):
+            new_ids[node] = new_id
+        self._relabel_nodes(new_ids)
+
+        previous_original_ids = self._original_ids or list(range(node_count + 1))
+        self._original_ids = [0] * (node_count + 1)
+        self._internal_ids = [0] * (node_count + 1)
+        for node in range(1, node_count + 1):
+            self._original_ids[new_ids[node]] = previous_original_ids[node]
+            self._internal_ids[previous_original_ids[node]] = new_ids[node]
+
+    def _get_breadth_first_order(self, by_degree: bool = False) -> list[int]:
+        '''
+        Returns every node in breadth-first order, restarting at each unvisited component.
+        With by_degree set this is the Cuthill-McKee order: components start at a node of minimum
+        out degree and neighbors are enqueued by increasing out degree.
+        '''
+        node_count = self.get_node_count()
+        degrees = [0] + [len(self._get_out_neighbors(node)) for node in range(1, node_count + 1)]
+        start_nodes = range(1, node_count + 1)
+        if by_degree:
+            start_nodes = sorted(start_nodes, key=degrees.__getitem__)
+
+        visited = [False] * (node_count + 1)
+        order: list[int] = []
+        for start_node in start_nodes:
+            if visited[start_node]:
+                continue
+            visited[start_node] = True
+            queue = deque([start_node])
+            while queue:
+                node = queue.popleft()
+                order.append(node)
+                neighbors = [neighbor for neighbor, _ in self._get_out_neighbors(node) if not visited[neighbor]]
+                if by_degree:
+                    neighbors.sort(key=degrees.__getitem__)
+                for neighbor in neighbors:
+                    if not visited[neighbor]:
+                        visited[neighbor] = True
+                        queue.append(neighbor)
+        return order
+
+    def get_node_label(self, node: int) -> str | None:
+        '''Returns the label of a node id, or None if the graph or the node has no label.'''
+        return self.labels.get_label(node) if self.labels is not None else None
+
+    def save_labels(self, file_path: str) -> None:
+        '''Persists the id to label mapping so the graph can be reloaded with the same ids.'''
+        if self.labels is None:
+            raise ValueError('Graph has no labels to save.')
+        self.labels.save(file_path)
+
     def validate_node_index(self, *nodes: int) -> None:
         '''Validates that the given node indices are within the valid range.'''
         node_count = self.get_node_count()
@@ -42,39 +249,39 @@ class GraphStructure(ABC):
 
     def get_edge_count(self) -> int:
         '''Returns the total number of edges in the graph.'''
-        return sum(len(self.get_out_neighbors(node)) for node in range(1, self.get_node_count() + 1)) // (1 if self.is_directed else 2)
+        return sum(len(self._get_out_neighbors(node)) for node in range(1, self.get_node_count() + 1)) // (1 if self.is_directed else 2)
 
     def get_min_out_degree(self) -> int:
         '''Returns the minimum out degree of any node in the graph.'''
-        return min(len(self.get_out_neighbors(node)) for node in range(1, self.get_node_count() + 1))
+        return min(len(self._get_out_neighbors(node)) for node in range(1, self.get_node_count() + 1))
 
     def get_max_out_degree(self) -> int:
         '''Returns the maximum out degree of any node in the graph.'''
         if self.is_directed:
             raise NotImplementedError('Maximum degree calculation is not implemented for directed graphs.')
-        return max(len(self.get_out_neighbors(node)) for node in range(1, self.get_node_count() + 1))
+        return max(len(self._get_out_neighbors(node)) for node in range(1, self.get_node_count() + 1))
 
     def get_average_out_degree(self) -> float:
         '''Returns the average out degree of nodes in the graph.'''
         node_count = self.get_node_count()
         if node_count == 0:
             return 0.0
-        return sum(len(self.get_out_neighbors(node)) for node in range(1, node_count + 1)) / node_count
+        return sum(len(self._get_out_neighbors(node)) for node in range(1, node_count + 1)) / node_count
 
     def get_median_out_degree(self) -> float:
         '''Returns the median out degree of nodes in the graph.'''
         node_count = self.get_node_count()
         if node_count == 0:
             return 0.0
-        sorted_degrees = sorted(len(self.get_out_neighbors(node)) for node in range(1, node_count + 1))
+        sorted_degrees = sorted(len(self._get_out_neighbors(node)) for node in range(1, node_count + 1))
         mid_index = node_count // 2
         if node_count % 2 == 0:
             return (sorted_degrees[mid_index - 1] + sorted_degrees[mid_index]) / 2
         return float(sorted_degrees[mid_index])
 
-    def search_breadth_first(self, start_node: int, text_file_path: str = '') -> list[tuple[int | None, int | None]]:
+    def search_breadth_first(self, start_node: int | str, text_file_path: str = '') -> list[tuple[int | None, int | None]]:
         '''Performs a breadth-first search (BFS) starting from the given node.'''
-        self.validate_node_index(start_node)
+        start_node = self._resolve_internal(start_node)
         node_count = self.get_node_count()
         visited: list[tuple[int | None, int | None]] = [(None, None) for _ in range(node_count + 1)]
         visited[start_node] = (None, 0)
@@ -82,10 +289,11 @@ class GraphStructure(ABC):
         queue = deque([start_node])
         while queue:
             current_node = queue.popleft()
-            for neighbor_index, _ in self.get_out_neighbors(current_node):
+            for neighbor_index, _ in self._get_out_neighbors(current_node):
                 if visited[neighbor_index][1] is None:
                     visited[neighbor_index] = (current_node, visited[current_node][1] + 1)
                     queue.append(neighbor_index)
+        visited = self._to_original_ids(visited, 0)
         
         if text_file_path:
             with open(text_file_path, 'w') as f:
@@ -94,11 +302,14 @@ class GraphStructure(ABC):
                     f.write(f'{index}\t{parent}\t{depth}\n')
         return visited
 
-    def search_depth_first(self, start_node: int, text_file_path: str = '') -> list[tuple[int | None, int | None]]:
+    def search_depth_first(self, start_node: int | str, text_file_path: str = '') -> list[tuple[int | None, int | None]]:
         '''Performs a depth-first search (DFS) starting from the given node.'''
-        self.validate_node_index(start_node)
+        start_node = self._resolve_internal(start_node)
         node_count = self.get_node_count()
         visited = [(None, None) for _ in range(node_count + 1)]
+        # Neighbors are visited in order of original id so a reordered graph yields the same tree.
+        original_ids = self._original_ids
+        sort_key = None if original_ids is None else lambda edge: (original_ids[edge[0]], edge[1])
 
         stack = deque([(start_node, None, 0)])
         while stack:
@@ -108,9 +319,10 @@ class GraphStructure(ABC):
             
             visited[current_node] = (parent, depth)
             
-            for neighbor_index, _ in sorted(self.get_out_neighbors(current_node), reverse=True):
+            for neighbor_index, _ in sorted(self._get_out_neighbors(current_node), key=sort_key, reverse=True):
                 if visited[neighbor_index][1] is None:
                     stack.append((neighbor_index, current_node, depth + 1))
+        visited = self._to_original_ids(visited, 0)
 
         if text_file_path:
             with open(text_file_path, 'w') as f:
@@ -119,8 +331,9 @@ class GraphStructure(ABC):
                     f.write(f'{index}\t{parent}\t{depth}\n')
         return visited
 
-    def get_edge_distance(self, node_1: int, node_2: int) -> int | None:
+    def get_edge_distance(self, node_1: int | str, node_2: int | str) -> int | None:
         '''Returns the shortest distance in edges between two nodes, or None if unreachable.'''
+        node_2 = self.resolve_node(node_2)
         self.validate_node_index(node_2)
         bfs_result = self.search_breadth_first(node_1)
         return bfs_result[node_2][1]
@@ -142,7 +355,13 @@ class GraphStructure(ABC):
         return max(final_depths)
 
     def list_connected_components(self) -> tuple[int, list[list[int]]]:
-        '''Returns the number of connected components and a list of lists with their nodes.'''
+        '''
+        Returns the number of connected components and a list of lists with their nodes.
+        For directed graphs these are the weakly connected components; see list_strongly_connected_components.
+        '''
+        if self.is_directed:
+            return self._list_weakly_connected_components()
+
         components: list[list[int]] = []
         node_count = self.get_node_count()
         visited_nodes = set()
@@ -160,40 +379,167 @@ class GraphStructure(ABC):
         components.sort(key=len, reverse=True)
         return len(components), components
 
-    def get_all_distances_and_fathers_from_start_node(self, start_node: int, queue_type: Type[GenericDijkstraStructuresManager] = DijkstraHeap) -> list[tuple[float, int | None]]:
+    def _list_weakly_connected_components(self) -> tuple[int, list[list[int]]]:
+        node_count = self.get_node_count()
+        undirected_neighbors: list[list[int]] = [[] for _ in range(node_count + 1)]
+        for node in range(1, node_count + 1):
+            for neighbor, _ in self._get_out_neighbors(node):
+                undirected_neighbors[node].append(neighbor)
+                undirected_neighbors[neighbor].append(node)
+
+        components: list[list[int]] = []
+        visited = [False] * (node_count + 1)
+        for start_node in range(1, node_count + 1):
+            if visited[start_node]:
+                continue
+            visited[start_node] = True
+            component = [start_node]
+            queue = deque([start_node])
+            while queue:
+                for neighbor in undirected_neighbors[queue.popleft()]:
+                    if not visited[neighbor]:
+                        visited[neighbor] = True
+                        component.append(neighbor)
+                        queue.append(neighbor)
+            components.append(sorted(component))
+
+        components = self._components_to_original_ids(components)
+        # Ties are broken by smallest original id so the order does not depend on reorder().
+        components.sort(key=lambda component: (-len(component), component[0]))
+        return len(components), components
+
+    def _find_strongly_connected_components(self) -> list[list[int]]:
+        '''Iterative Tarjan; components come out in reverse topological order of the condensation.'''
+        node_count = self.get_node_count()
+        index = [0] * (node_count + 1)
+        low = [0] * (node_count + 1)
+        on_stack = [False] * (node_count + 1)
+        stack: list[int] = []
+        components: list[list[int]] = []
+        next_index = 1
+
+        for root in range(1, node_count + 1):
+            if index[root]:
+                continue
+            index[root] = low[root] = next_index
+            next_index += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, iter(self._get_out_neighbors(root)))]
+            while work:
+                node, neighbors = work[-1]
+                for neighbor, _ in neighbors:
+                    if not index[neighbor]:
+                        index[neighbor] = low[neighbor] = next_index
+                        next_index += 1
+                        stack.append(neighbor)
+                        on_stack[neighbor] = True
+                        work.append((neighbor, iter(self._get_out_neighbors(neighbor))))
+                        break
+                    if on_stack[neighbor] and index[neighbor] < low[node]:
+                        low[node] = index[neighbor]
+                else:
+                    work.pop()
+                    if work and low[node] < low[work[-1][0]]:
+                        low[work[-1][0]] = low[node]
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+        return components
+
+    def list_strongly_connected_components(self) -> tuple[int, list[list[int]]]:
+        '''Returns the number of strongly connected components and a list of lists with their nodes.'''
+        components = [sorted(component) for component in self._find_strongly_connected_components()]
+        components = self._components_to_original_ids(components)
+        components.sort(key=lambda component: (-len(component), component[0]))
+        return len(components), components
+
+    def get_condensation(self) -> tuple[list[int], list[list[int]], list[set[int]]]:
+        '''
+        Returns the condensation of the graph: the component index of each node, the strongly connected
+        components in topological order and, for each component, the set of components it has edges to.
+        '''
+        components = self._find_strongly_connected_components()[::-1]
+        component_of = [-1] * (self.get_node_count() + 1)
+        for component_index, component in enumerate(components):
+            for node in component:
+                component_of[node] = component_index
+
+        dag: list[set[int]] = [set() for _ in components]
+        for component_index, component in enumerate(components):
+            for node in component:
+                for neighbor, _ in self._get_out_neighbors(node):
+                    if component_of[neighbor] != component_index:
+                        dag[component_index].add(component_of[neighbor])
+
+        if self._original_ids is not None:
+            component_of = [component_of[self._internal_ids[node]] if node else -1 for node in range(len(component_of))]
+            components = [[self._original_ids[node] for node in component] for component in components]
+        return component_of, components, dag
+
+    def get_all_distances_and_fathers_from_start_node(self, start_node: int | str, queue_type: Type[GenericDijkstraStructuresManager] = DijkstraHeap) -> list[tuple[float, int | None]]:
         '''Given a start node, returns the distance to all other nodes, and its father through best path'''
+        start_node = self._resolve_internal(start_node)
         if self.has_negative_weight:
             raise ValueError('Graph contains negative weight edges; Dijkstra\'s algorithm cannot be applied. Algorithms for negative weights not implemented yet.')
-        dijkstra_manager = queue_type(start_node, self.get_node_count())
+        dijkstra_manager = queue_type(start_node, self.get_node_count(), exact=self.weight_scale is not None)
         while next := dijkstra_manager.get_next_min():
             current_node, current_distance = next
-            for neighbor, weight in self.get_out_neighbors(current_node):
+            for neighbor, weight in self._get_out_neighbors(current_node):
                 dijkstra_manager.update_distance(current_node, current_distance, neighbor, weight)
-        return dijkstra_manager.result()
+        return self._to_original_ids(self._unscale_distances(dijkstra_manager.result()), 1)
     
-    def get_all_distances_and_sons_to_end_node(self, end_node: int) -> list[tuple[float, int | None]]:
-        '''Given an end node, returns the distance from all other nodes, and its sons through best path'''
-        self.validate_node_index(end_node)
+    def get_all_distances_and_sons_to_end_node(self, end_node: int | str) -> list[tuple[float, int | None]]:
+        '''
+        Given an end node, returns the distance from all other nodes, and its sons through best path.
+        Strongly connected components are solved from the sinks of the condensation backwards: acyclic
+        components need a single relaxation pass and Bellman-Ford only runs inside cyclic ones.
+        '''
+        end_node = self._resolve_internal(end_node)
         node_count = self.get_node_count()
         distances_and_sons: list[tuple[float, int | None]] = [(float('inf'), None) for _ in range(node_count + 1)]
-        distances_and_sons[end_node] = (0.0, None)
-        converged = False
-        for i in range(1, node_count):
-            print('i', i)
-            if converged:
-                break
-            converged = True
-            for node in range(1, node_count + 1):
-                for neighbor, weight in self.get_out_neighbors(node):
+        exact = self.weight_scale is not None
+        distances_and_sons[end_node] = (0 if exact else 0.0, None)
+
+        # The relaxation is picked once per run so the float path pays only for its own rounding.
+        def relax_exact(component: list[int]) -> bool:
+            changed = False
+            for node in component:
+                for neighbor, weight in self._get_out_neighbors(node):
+                    if (new_value := distances_and_sons[neighbor][0] + weight) < distances_and_sons[node][0]:
+                        distances_and_sons[node] = (new_value, neighbor)
+                        changed = True
+            return changed
+
+        def relax_rounded(component: list[int]) -> bool:
+            changed = False
+            for node in component:
+                for neighbor, weight in self._get_out_neighbors(node):
                     if (new_value := round(distances_and_sons[neighbor][0] + weight, 2)) < distances_and_sons[node][0]:
                         distances_and_sons[node] = (new_value, neighbor)
-                        converged = False
-        else:
-            for node in range(1, node_count + 1):
-                for neighbor, weight in self.get_out_neighbors(node):
-                        if round(distances_and_sons[neighbor][0] + weight, 2) < distances_and_sons[node][0]:
-                            raise ValueError('Graph contains a negative weight cycle; shortest paths not well-defined.')
-        return distances_and_sons
+                        changed = True
+            return changed
+
+        relax = relax_exact if exact else relax_rounded
+
+        for component in self._find_strongly_connected_components():
+            node = component[0]
+            if len(component) == 1 and all(neighbor != node for neighbor, _ in self._get_out_neighbors(node)):
+                relax(component)
+                continue
+            for _ in range(len(component)):
+                if not relax(component):
+                    break
+            else:
+                if relax(component):
+                    raise ValueError('Graph contains a negative weight cycle; shortest paths not well-defined.')
+        return self._to_original_ids(self._unscale_distances(distances_and_sons), 1)
 
     def generate_graph_text_file(self, file_path: str) -> None:
         '''Generates a text file representation of the graph's properties.'''
@@ -0,0 +1,387 @@
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from .generic_structure import GraphStructure, ORDERINGS
+from .adjacency_matrix import AdjacencyMatrix
+from .adjacency_vector import AdjacencyVector
+from lib.classes.dijkstra.dijkstra_buckets import DijkstraBuckets
+from lib.classes.dijkstra.dijkstra_heap import DijkstraHeap
+from lib.classes.dijkstra.dijkstra_vector import DijkstraVector
+
+STRUCTURE_TYPES = {'vector': AdjacencyVector, 'matrix': AdjacencyMatrix}
+QUEUE_TYPES = {'heap': DijkstraHeap, 'vector': DijkstraVector, 'buckets': DijkstraBuckets}
+# Largest request or response line accepted; full per-node results on large graphs exceed asyncio's 64 KiB default.
+STREAM_LIMIT = 256 * 1024 * 1024
+POOL_OPERATIONS = ('info', 'bfs', 'distance', 'dijkstra', 'bellman_ford', 'components', 'strong_components', 'memory')
+
+# Graphs resident in each worker process, filled once by the pool initializer.
+_worker_graphs: dict[str, GraphStructure] = {}
+_worker_barrier = None
+
+
+def load_graph(spec: dict[str, Any]) -> GraphStructure:
+    '''Builds a graph structure from a spec with "path", "structure", "is_directed", "reverse", "labeled", "labels", "weight_scale" and "order" keys.'''
+    structure = STRUCTURE_TYPES[spec.get('structure', 'vector')]
+    graph = structure(
+        spec['path'],
+        is_directed=spec.get('is_directed', False),
+        reverse=spec.get('reverse', False),
+        labeled=spec.get('labeled', False),
+        labels_file_path=spec.get('labels', ''),
+        weight_scale=spec.get('weight_scale'),
+    )
+    if spec.get('order'):
+        graph.reorder(spec['order'])
+    return graph
+
+
+def _load_worker_graphs(graph_specs: dict[str, dict[str, Any]], barrier) -> None:
+    global _worker_barrier
+    _worker_barrier = barrier
+    for name, spec in graph_specs.items():
+        _worker_graphs[name] = load_graph(spec)
+
+
+def _warm_up() -> int:
+    # Blocking until every worker has arrived keeps one worker from taking several warm-up calls.
+    _worker_barrier.wait()
+    return os.getpid()
+
+
+def _select_targets(graph: GraphStructure, result: list, targets: list[int | str] | None) -> list | dict[int | str, Any]:
+    '''Picks the entries of the given targets, by id or label, keyed as the client sent them.'''
+    if targets is None:
+        return result
+    selected = {}
+    for target in targets:
+        node = graph.resolve_node(target)
+        graph.validate_node_index(node)
+        selected[target] = result[node]
+    return selected
+
+
+def _to_json_value(value: Any) -> Any:
+    '''Converts tuples to lists and non-finite floats, such as unreachable distances, to None.'''
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_json_value(item) for key, item in value.items()}
+    return value
+
+
+def _run_query(graph_name: str, operation: str, args: dict[str, Any]) -> tuple[Any, float]:
+    '''Runs a single query against a resident graph; executed inside a worker process.'''
+    graph = _worker_graphs[graph_name]
+    start_time = time.perf_counter()
+    if operation == 'info':
+        result = {
+            'node_count': graph.get_node_count(),
+            'edge_count': graph.get_edge_count(),
+            'is_directed': graph.is_directed,
+            'has_negative_weight': graph.has_negative_weight,
+        }
+    elif operation == 'memory':
+        result = graph.get_memory_usage()
+    elif operation == 'bfs':
+        result = _select_targets(graph, graph.search_breadth_first(args['start_node']), args.get('targets'))
+    elif operation == 'distance':
+        result = graph.get_edge_distance(args['node_1'], args['node_2'])
+    elif operation == 'dijkstra':
+        queue_type = QUEUE_TYPES[args.get('queue', 'heap')]
+        result = _select_targets(graph, graph.get_all_distances_and_fathers_from_start_node(args['start_node'], queue_type), args.get('targets'))
+    elif operation == 'bellman_ford':
+        result = _select_targets(graph, graph.get_all_distances_and_sons_to_end_node(args['end_node']), args.get('targets'))
+    else:
+        if operation == 'components':
+            count, components = graph.list_connected_components()
+        else:
+            count, components = graph.list_strongly_connected_components()
+        result = {'count': count, 'sizes': [len(component) for component in components]}
+        if args.get('with_nodes', False):
+            result['components'] = components
+    return _to_json_value(result), time.perf_counter() - start_time
+
+
+class GraphQueryServer:
+    '''
+    Long-lived query service keeping graphs resident in a process pool.
+
+    Requests and responses are newline-delimited JSON objects. A request looks like
+    {"id": 1, "graph": "g1", "op": "dijkstra", "args": {"start_node": 10, "targets": [20, 30]}}
+    and is answered with {"id": 1, "ok": true, "result": ..., "latency_ms": ..., "compute_ms": ..., "coalesced": false}.
+    Unreachable distances are sent as null.
+    Nodes may be given by label on graphs loaded with labels.
+    Identical queries that arrive while one is still running share its result.
+    Every worker process holds its own copy of each graph, so memory grows with max_workers.
+    '''
+
+    def __init__(self, graph_specs: dict[str, dict[str, Any]], max_workers: int = 1) -> None:
+        if max_workers < 1:
+            raise ValueError(f'max_workers must be at least 1, got {max_workers}.')
+        self.graph_specs = graph_specs
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._in_flight: dict[tuple[str, str, str], asyncio.Future] = {}
+        self._stats: dict[str, dict[str, float]] = {}
+
+    async def start(self) -> None:
+        '''Starts the worker pool and waits until every worker has loaded the graphs.'''
+        loop = asyncio.get_running_loop()
+        barrier = multiprocessing.Barrier(self.max_workers)
+        self._executor = ProcessPoolExecutor(self.max_workers, initializer=_load_worker_graphs, initargs=(self.graph_specs, barrier))
+        await asyncio.gather(*(loop.run_in_executor(self._executor, _warm_up) for _ in range(self.max_workers)))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8765, unix_path: str = '') -> None:
+        '''Loads the graphs and serves queries on a TCP port, or on a Unix socket when unix_path is given.'''
+        await self.start()
+        try:
+            if unix_path:
+                server = await asyncio.start_unix_server(self._handle_client, path=unix_path, limit=STREAM_LIMIT)
+            else:
+                server = await asyncio.start_server(self._handle_client, host, port, limit=STREAM_LIMIT)
+            async with server:
+                print(f'Serving graphs {sorted(self.graph_specs)} on {unix_path or f"{host}:{port}"}')
+                await server.serve_forever()
+        finally:
+            self.close()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        write_lock = asyncio.Lock()
+        pending: set[asyncio.Task] = set()
+
+        async def send(response: dict[str, Any]) -> None:
+            async with write_lock:
+                writer.write(json.dumps(response, allow_nan=False).encode() + b'\n')
+                await writer.drain()
+
+        async def respond(line: bytes) -> None:
+            await send(await self.handle_request(line))
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The rest of an oversized line cannot be told apart from the next request, so the connection ends here.
+                    await send({'id': None, 'ok': False, 'error': f'ValueError: Request line longer than {STREAM_LIMIT} bytes.'})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(respond(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            for task in pending:
+                task.cancel()
+            writer.close()
+
+    async def handle_request(self, line: bytes) -> dict[str, Any]:
+        '''Decodes a request line and returns the response object to send back.'''
+        received_time = time.perf_counter()
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            operation = request.get('op')
+            if operation == 'stats':
+                return {'id': request_id, 'ok': True, 'result': self.get_stats()}
+            graph_name = request.get('graph')
+            if graph_name not in self.graph_specs:
+                raise ValueError(f'Unknown graph "{graph_name}".')
+            if operation not in POOL_OPERATIONS:
+                raise ValueError(f'Unknown operation "{operation}".')
+            result, compute_time, coalesced = await self.query(graph_name, operation, request.get('args', {}))
+        except Exception as e:
+            return {'id': request_id, 'ok': False, 'error': f'{type(e).__name__}: {e}'}
+
+        latency = time.perf_counter() - received_time
+        self._record(operation, latency, coalesced)
+        return {
+            'id': request_id,
+            'ok': True,
+            'result': result,
+            'latency_ms': round(latency * 1000, 3),
+            'compute_ms': round(compute_time * 1000, 3),
+            'coalesced': coalesced,
+        }
+
+    async def query(self, graph_name: str, operation: str, args: dict[str, Any]) -> tuple[Any, float, bool]:
+        '''Runs a query in the pool, joining an identical in-flight query when there is one.'''
+        key = (graph_name, operation, json.dumps(args, sort_keys=True))
+        future = self._in_flight.get(key)
+        coalesced = future is not None
+        if future is None:
+            if self._executor is None:
+                raise RuntimeError('Server has not been started.')
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, _run_query, graph_name, operation, args)
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        result, compute_time = await asyncio.shield(future)
+        return result, compute_time, coalesced
+
+    def _record(self, operation: str, latency: float, coalesced: bool) -> None:
+        stats = self._stats.setdefault(operation, {'count': 0, 'coalesced': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+        latency_ms = latency * 1000
+        stats['count'] += 1
+        stats['coalesced'] += int(coalesced)
+        stats['total_ms'] += latency_ms
+        stats['max_ms'] = max(stats['max_ms'], latency_ms)
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        '''Returns per-operation query counts and latencies in milliseconds.'''
+        return {
+            operation: {**stats, 'average_ms': stats['total_ms'] / stats['count']}
+            for operation, stats in self._stats.items()
+        }
+
+
+class GraphQueryClient:
+    '''Asyncio client for GraphQueryServer; concurrent queries on one connection are matched by id.'''
+
+    def __init__(self) -> None:
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._reader_task: asyncio.Task | None = None
+
+    async def connect(self, host: str = '127.0.0.1', port: int = 8765, unix_path: str = '') -> None:
+        if unix_path:
+            self._reader, self._writer = await asyncio.open_unix_connection(unix_path, limit=STREAM_LIMIT)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(host, port, limit=STREAM_LIMIT)
+        self._reader_task = asyncio.create_task(self._read_responses())
+
+    async def _read_responses(self) -> None:
+        reason = 'Connection to graph query server closed.'
+        try:
+            while True:
+                try:
+                    line = await self._reader.readline()
+                except ValueError:
+                    reason = f'Response line longer than {STREAM_LIMIT} bytes; connection to graph query server dropped.'
+                    break
+                if not line:
+                    break
+                try:
+                    response = json.loads(line)
+                except json.JSONDecodeError as e:
+                    # Without an id the response cannot be matched, so the connection is given up.
+                    reason = f'Malformed response from graph query server ({e}); connection dropped.'
+                    break
+                future = self._pending.pop(response.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(reason))
+            self._pending.clear()
+
+    async def request(self, graph_name: str | None, operation: str, **args: Any) -> dict[str, Any]:
+        '''Sends a query and returns the full response, including its latency fields.'''
+        if self._writer is None:
+            raise RuntimeError('Client is not connected.')
+        if self._reader_task is None or self._reader_task.done():
+            raise ConnectionError('Connection to graph query server closed.')
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(json.dumps({'id': request_id, 'graph': graph_name, 'op': operation, 'args': args}, allow_nan=False).encode() + b'\n')
+        await self._writer.drain()
+        return await future
+
+    async def query(self, graph_name: str, operation: str, **args: Any) -> Any:
+        '''Sends a query and returns only its result, raising ValueError when the server reports an error.'''
+        response = await self.request(graph_name, operation, **args)
+        if not response['ok']:
+            raise ValueError(response['error'])
+        return response['result']
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+        if self._reader_task is not None:
+            await self._reader_task
+            self._reader_task = None
+
+
+def parse_graph_spec(text: str) -> tuple[str, dict[str, Any]]:
+    '''Parses "name=path[,directed][,reverse][,matrix][,labeled][,labels=path][,scale=n][,order=identity|rcm|bfs|degree]" into a graph name and its spec.'''
+    name, _, rest = text.partition('=')
+    if not name or not rest:
+        raise argparse.ArgumentTypeError(f'Invalid graph spec "{text}"; expected name=path[,directed][,reverse][,matrix][,labeled][,labels=path][,scale=n][,order=identity|rcm|bfs|degree].')
+    path, *options = rest.split(',')
+    labels_file_path = ''
+    weight_scale = None
+    order = ''
+    for option in options:
+        if option.startswith('labels='):
+            labels_file_path = option.removeprefix('labels=')
+        elif option.startswith('scale='):
+            scale = option.removeprefix('scale=')
+            if not scale.isdigit() or int(scale) <= 0:
+                raise argparse.ArgumentTypeError(f'Invalid scale "{scale}" in "{text}"; expected a positive integer.')
+            weight_scale = int(scale)
+        elif option.startswith('order='):
+            order = option.removeprefix('order=')
+            if order not in ('identity', *ORDERINGS):
+                raise argparse.ArgumentTypeError(f'Invalid order "{order}" in "{text}"; expected identity or one of {", ".join(ORDERINGS)}.')
+    options = [option for option in options if not option.startswith(('labels=', 'scale=', 'order='))]
+    unknown = set(options) - {'directed', 'reverse', 'matrix', 'vector', 'labeled'}
+    if unknown:
+        raise argparse.ArgumentTypeError(f'Unknown graph options {sorted(unknown)} in "{text}".')
+    return name, {
+        'path': path,
+        'structure': 'matrix' if 'matrix' in options else 'vector',
+        'is_directed': 'directed' in options,
+        'reverse': 'reverse' in options,
+        'labeled': 'labeled' in options,
+        'labels': labels_file_path,
+        'weight_scale': weight_scale,
+        'order': order,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Serve BFS, distance, Dijkstra and component queries over resident graphs.')
+    parser.add_argument('--graph', action='append', type=parse_graph_spec, required=True, help='name=path[,directed][,reverse][,matrix][,labeled][,labels=path][,scale=n][,order=identity|rcm|bfs|degree]; may be repeated')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', default='', help='serve on this Unix socket path instead of TCP')
+    parser.add_argument('--workers', type=int, default=1, help='worker processes, each holding its own copy of every graph (default 1)')
+    options = parser.parse_args()
+
+    server = GraphQueryServer(dict(options.graph), options.workers)
+    try:
+        asyncio.run(server.serve(options.host, options.port, options.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()